@@ -24,6 +24,10 @@ BETA = 0.5   # Weight for complexity in combined score (higher = favor simple pa
 #   α < β: Fidelity-driven, favors simple patterns with low mutation
 #   α = β: Balanced, creates stable diversity around utility patterns
 
+# Performance parameters
+USE_NUMBA = True  # Run the generation update as a compiled parallel kernel
+                  # (falls back to the vectorized numpy path if numba is missing)
+
 # Visualization parameters
 CELL_SIZE = 8  # Size of each pixel in the 4x4 meme bitmap (total: 32x32 per agent)
 FPS = 10  # Frames per second for visualization
@@ -2,9 +2,8 @@
 Agent class representing a host that carries and replicates memes.
 """
 import numpy as np
-import copy
-from typing import List, Optional
-from core.meme import Meme
+from typing import List
+from core.meme import Meme, COMPLEXITY_LUT, UTILITY_LUT, FITNESS_LUT
 import config
 
 
@@ -12,68 +11,96 @@ class Agent:
     """
     An agent is a host located at (x, y) that maintains a pool of memes
     and performs internal and external replication.
+
+    The agent is a thin view: the actual pool state lives in the grid's
+    structure-of-arrays storage (bit-packed codes and ages), and the
+    agent reads and writes its (x, y) slice of those arrays.
     """
-    
-    def __init__(self, x: int, y: int, initial_memes: List[Meme]):
+
+    __slots__ = ('grid', 'x', 'y')
+
+    def __init__(self, grid, x: int, y: int):
         """
-        Initialize an agent with a position and initial meme pool.
-        
+        Initialize an agent view over the grid's pool arrays.
+
         Args:
+            grid: The Grid owning the pool arrays
             x: X coordinate on grid
             y: Y coordinate on grid
-            initial_memes: Initial list of memes (should not exceed POOL_SIZE)
         """
+        self.grid = grid
         self.x = x
         self.y = y
-        self.meme_pool: List[Meme] = initial_memes[:config.POOL_SIZE]
-        assert len(self.meme_pool) > 0, "Agent must have at least one meme"
-    
-    def get_dominant_meme(self) -> Meme:
+
+    @property
+    def meme_pool(self) -> List[Meme]:
         """
-        Select the dominant meme from the pool.
-        
+        Materialize the pool as Meme objects (debug/stats path only; the
+        hot paths work on the grid arrays directly).
+        """
+        codes = self.grid.codes[self.x, self.y]
+        ages = self.grid.ages[self.x, self.y]
+        return [
+            Meme.from_code(int(code), age=int(age))
+            for code, age in zip(codes, ages)
+        ]
+
+    def get_dominant_index(self) -> int:
+        """
+        Select the pool index of the dominant meme.
+
         If utility selection is enabled: Select meme with HIGHEST combined score S = (α × U) - (β × C)
         Otherwise: Select meme with LOWEST complexity (original behavior)
-        
+
+        Returns:
+            Index of the dominant meme in the pool
+        """
+        # Highest cached fitness covers both election rules (highest
+        # combined score under utility selection, lowest complexity
+        # otherwise)
+        return int(np.argmax(self.grid.scores[self.x, self.y]))
+
+    def get_dominant_meme(self) -> Meme:
+        """
+        Select the dominant meme from the pool.
+
         Returns:
             The dominant meme from the pool
         """
-        if config.USE_UTILITY_SELECTION:
-            # Select meme with highest combined score
-            return max(
-                self.meme_pool, 
-                key=lambda m: m.combined_score(config.ALPHA, config.BETA)
-            )
-        else:
-            # Original behavior: lowest complexity
-            return min(self.meme_pool, key=lambda m: m.complexity)
-    
+        idx = self.get_dominant_index()
+        return Meme.from_code(
+            int(self.grid.codes[self.x, self.y, idx]),
+            age=int(self.grid.ages[self.x, self.y, idx]),
+        )
+
     def internal_rehearsal(self, rng: np.random.Generator):
         """
         Perform internal rehearsal: randomly select a meme and copy it
         with internal mutation rate.
-        
+
         This models memory decay/reinterpretation.
-        
+
         Args:
             rng: Random number generator
         """
-        # Select a random meme from pool
-        source_meme = rng.choice(self.meme_pool)
-        
+        # Select a random meme from pool by index (rng.choice pays Python
+        # protocol overhead per call; a direct integer draw does not)
+        idx = rng.integers(0, config.POOL_SIZE)
+        source_code = int(self.grid.codes[self.x, self.y, idx])
+
         # Copy it with internal mutation
-        rehearsed_meme = source_meme.copy_with_mutation(
+        rehearsed_meme = Meme.from_code(source_code).copy_with_mutation(
             config.MU_BASE_INTERNAL, rng
         )
-        
-        # Add to pool (will be cleaned up if needed)
-        self._add_to_pool(rehearsed_meme)
-    
+
+        # Add to pool (evicting the least fit meme if needed)
+        self.add_code(rehearsed_meme.code)
+
     def receive_meme(self, source_meme: Meme, rng: np.random.Generator):
         """
         Receive a meme from a neighbor (external transmission).
         The meme is copied with external mutation rate and added to pool.
-        
+
         Args:
             source_meme: The dominant meme from a neighbor
             rng: Random number generator
@@ -82,60 +109,69 @@ class Agent:
         invaded_meme = source_meme.copy_with_mutation(
             config.MU_BASE_EXTERNAL, rng
         )
-        
+
         # Add to pool
-        self._add_to_pool(invaded_meme)
-    
+        self.add_code(invaded_meme.code)
+
+    def add_code(self, code: int, age: int = 0):
+        """
+        Add a meme code to the pool. The pool arrays are always full at
+        POOL_SIZE, so adding evicts the least fit among the current memes
+        plus the candidate; if the candidate itself is least fit, the
+        pool is unchanged.
+
+        If utility selection is enabled: Evict meme with LOWEST combined score S = (α × U) - (β × C)
+        Otherwise: Evict meme with HIGHEST complexity (original behavior)
+
+        Args:
+            code: Bit-packed meme code to add
+            age: Age of the added meme
+        """
+        codes = self.grid.codes[self.x, self.y]
+        scores = self.grid.scores[self.x, self.y]
+        candidate_fitness = FITNESS_LUT[code]
+
+        # Lowest cached fitness covers both eviction rules (lowest
+        # combined score under utility selection, highest complexity
+        # otherwise)
+        evict_idx = int(np.argmin(scores))
+        if candidate_fitness >= scores[evict_idx]:
+            codes[evict_idx] = code
+            scores[evict_idx] = candidate_fitness
+            self.grid.ages[self.x, self.y, evict_idx] = age
+            self.grid._dominant_fresh = False
+
     def _add_to_pool(self, meme: Meme):
         """
-        Add a meme to the pool. If pool is full, remove the least fit meme.
-        
-        If utility selection is enabled: Remove meme with LOWEST combined score S = (α × U) - (β × C)
-        Otherwise: Remove meme with HIGHEST complexity (original behavior)
-        
+        Add a meme to the pool, evicting the least fit meme if needed.
+
         Args:
             meme: Meme to add to pool
         """
-        self.meme_pool.append(meme)
-        
-        # If pool exceeds size limit, remove least fit meme
-        if len(self.meme_pool) > config.POOL_SIZE:
-            if config.USE_UTILITY_SELECTION:
-                # Remove meme with lowest combined score
-                min_score_idx = min(
-                    range(len(self.meme_pool)),
-                    key=lambda i: self.meme_pool[i].combined_score(config.ALPHA, config.BETA)
-                )
-                self.meme_pool.pop(min_score_idx)
-            else:
-                # Original behavior: remove highest complexity
-                max_complexity_idx = max(
-                    range(len(self.meme_pool)),
-                    key=lambda i: self.meme_pool[i].complexity
-                )
-                self.meme_pool.pop(max_complexity_idx)
-    
+        self.add_code(meme.code, age=meme.age)
+
     def age_memes(self):
-        """Increment the age of all memes in the pool."""
-        for meme in self.meme_pool:
-            meme.increment_age()
-    
+        """Increment the age of all memes in the pool (saturating at 255)."""
+        ages = self.grid.ages[self.x, self.y]
+        np.add(ages, 1, out=ages, where=ages < 255)
+
     def get_pool_stats(self) -> dict:
         """
         Get statistics about the current meme pool.
-        
+
         Returns:
             Dictionary with pool statistics
         """
-        complexities = [m.complexity for m in self.meme_pool]
-        utilities = [m.utility for m in self.meme_pool]
-        ages = [m.age for m in self.meme_pool]
-        scores = [m.combined_score(config.ALPHA, config.BETA) for m in self.meme_pool]
-        
-        dominant = self.get_dominant_meme()
-        
+        codes = self.grid.codes[self.x, self.y]
+        complexities = COMPLEXITY_LUT[codes]
+        utilities = UTILITY_LUT[codes]
+        scores = config.ALPHA * utilities - config.BETA * complexities
+        ages = self.grid.ages[self.x, self.y]
+
+        dominant_idx = self.get_dominant_index()
+
         return {
-            'pool_size': len(self.meme_pool),
+            'pool_size': len(codes),
             'avg_complexity': np.mean(complexities),
             'min_complexity': np.min(complexities),
             'max_complexity': np.max(complexities),
@@ -144,31 +180,10 @@ class Agent:
             'max_utility': np.max(utilities),
             'avg_score': np.mean(scores),
             'avg_age': np.mean(ages),
-            'dominant_complexity': dominant.complexity,
-            'dominant_utility': dominant.utility,
-            'dominant_score': dominant.combined_score(config.ALPHA, config.BETA),
+            'dominant_complexity': complexities[dominant_idx],
+            'dominant_utility': utilities[dominant_idx],
+            'dominant_score': scores[dominant_idx],
         }
-    
-    def copy(self) -> 'Agent':
-        """
-        Create a deep copy of this agent with copied meme pool.
-        This is needed for proper state update in the CA simulation.
-        
-        Returns:
-            A new Agent instance with deep-copied meme pool
-        """
-        # Deep copy all memes in the pool
-        copied_memes = []
-        for meme in self.meme_pool:
-            # Create new meme with copied pattern and same age
-            copied_pattern = meme.pattern.copy()
-            copied_meme = Meme(copied_pattern.tolist(), age=meme.age)
-            copied_memes.append(copied_meme)
-        
-        # Create new agent with copied memes
-        new_agent = Agent(self.x, self.y, copied_memes)
-        return new_agent
-    
-    def __repr__(self) -> str:
-        return f"Agent({self.x}, {self.y}) with {len(self.meme_pool)} memes"
 
+    def __repr__(self) -> str:
+        return f"Agent({self.x}, {self.y}) with {self.grid.codes.shape[-1]} memes"
@@ -4,7 +4,7 @@ Grid class managing the spatial 2D environment for the simulation.
 import numpy as np
 from typing import List, Tuple
 from core.agent import Agent
-from core.meme import Meme
+from core.meme import Meme, COMPLEXITY_LUT, UTILITY_LUT, FITNESS_LUT, unpack_codes
 import config
 
 
@@ -12,32 +12,67 @@ class Grid:
     """
     A 2D grid of agents with toroidal boundary conditions.
     Supports Moore neighborhood (8 neighbors including diagonals).
+
+    Grid state is stored as structure-of-arrays: a (size, size, POOL_SIZE)
+    uint16 array of bit-packed meme codes plus a matching uint8 array of
+    ages, with the pool index as the fastest-varying axis. Agents are thin
+    views into these arrays, so the hot loops touch contiguous numpy
+    storage instead of chasing per-agent Python objects.
     """
-    
+
     def __init__(self, size: int, rng: np.random.Generator):
         """
         Initialize a grid of agents with random memes.
-        
+
         Args:
             size: Grid dimension (size x size)
             rng: Random number generator
         """
         self.size = size
         self.rng = rng
+
+        # Structure-of-arrays pool state, initialized with white noise
+        self.codes = rng.integers(
+            0, 1 << config.MEME_LENGTH,
+            size=(size, size, config.POOL_SIZE), dtype=np.uint16
+        )
+        self.ages = np.zeros((size, size, config.POOL_SIZE), dtype=np.uint8)
+
+        # Cached selection fitness per pool slot, kept in sync with
+        # `codes` on every write. Elections and evictions then reduce over
+        # this float32 array directly instead of re-gathering the lookup
+        # tables for the whole grid each generation.
+        self.scores = FITNESS_LUT[self.codes]
+
+        # Thin agent views over the pool arrays
         self.agents = np.empty((size, size), dtype=object)
-        
-        # Initialize all agents with random memes
         for x in range(size):
             for y in range(size):
-                initial_memes = [
-                    Meme.random(rng) for _ in range(config.POOL_SIZE)
-                ]
-                self.agents[x, y] = Agent(x, y, initial_memes)
-    
+                self.agents[x, y] = Agent(self, x, y)
+
+        # Precomputed Moore-neighbor index tables with toroidal
+        # wrap-around: neighbor_x[x, d] / neighbor_y[y, d] give the
+        # coordinates of neighbor d (0..7), hoisting the per-call modulo
+        # arithmetic out of the hot loops
+        offsets_x = np.array([-1, -1, -1, 0, 0, 1, 1, 1])
+        offsets_y = np.array([-1, 0, 1, -1, 1, -1, 0, 1])
+        coords = np.arange(size)
+        self.neighbor_x = ((coords[:, np.newaxis] + offsets_x) % size).astype(np.int16)
+        self.neighbor_y = ((coords[:, np.newaxis] + offsets_y) % size).astype(np.int16)
+
+        # Reusable buffer for the per-generation dominant-code snapshot,
+        # so the CA-style simultaneous update costs one buffer fill per
+        # step instead of fresh allocations (the old per-agent deep copy).
+        # The freshness flag lets stats and rendering reuse the election
+        # already performed by the update instead of re-running it; any
+        # pool write clears it.
+        self.dominant_codes = np.empty((size, size), dtype=np.uint16)
+        self._dominant_fresh = False
+
     def inject_patterns(self, patterns: List[List[int]]):
         """
         Inject specific seed patterns into random locations on the grid.
-        
+
         Args:
             patterns: List of binary patterns to inject
         """
@@ -45,117 +80,132 @@ class Grid:
             # Choose random location
             x = self.rng.integers(0, self.size)
             y = self.rng.integers(0, self.size)
-            
+
             # Create seed meme and add to agent's pool
             seed_meme = Meme(pattern)
             agent = self.agents[x, y]
             agent._add_to_pool(seed_meme)
-    
-    def get_moore_neighbors(self, x: int, y: int) -> List[Agent]:
+
+    def get_moore_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
         """
         Get the 8 Moore neighbors of an agent (including diagonals).
         Uses toroidal boundary conditions (wrap-around).
-        
+
         Args:
             x: X coordinate
             y: Y coordinate
-            
+
         Returns:
-            List of 8 neighboring agents
-        """
-        neighbors = []
-        
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue  # Skip self
-                
-                # Toroidal wrap-around
-                nx = (x + dx) % self.size
-                ny = (y + dy) % self.size
-                
-                neighbors.append(self.agents[nx, ny])
-        
-        return neighbors
-    
+            List of 8 neighboring (x, y) index tuples
+        """
+        return list(zip(self.neighbor_x[x], self.neighbor_y[y]))
+
     def get_agent(self, x: int, y: int) -> Agent:
         """
         Get the agent at position (x, y).
-        
+
         Args:
             x: X coordinate
             y: Y coordinate
-            
+
         Returns:
             Agent at that position
         """
         return self.agents[x, y]
-    
+
     def get_all_agents(self) -> List[Agent]:
         """
         Get a flat list of all agents in the grid.
-        
+
         Returns:
             List of all agents
         """
         return self.agents.flatten().tolist()
-    
-    def set_all_agents(self, agents: List[Agent]):
+
+    def insert_codes(self, candidate_codes: np.ndarray):
         """
-        Update the grid with a new list of agents.
-        Agents must be in row-major order matching the grid dimensions.
-        
+        Insert one candidate code per agent into every pool at once.
+
+        Mirrors Agent.add_code, fused across the grid: one LUT gather
+        for the candidates, one argmin over the cached pool scores for
+        the eviction targets, and one scatter for the replacements. Pools
+        whose candidate is itself the least fit are left unchanged.
+
         Args:
-            agents: List of agents (length must equal size * size)
-        """
-        assert len(agents) == self.size * self.size, \
-            f"Agent list must contain {self.size * self.size} agents"
-        
-        # Reshape flat list back into 2D grid
-        idx = 0
-        for x in range(self.size):
-            for y in range(self.size):
-                self.agents[x, y] = agents[idx]
-                idx += 1
-    
+            candidate_codes: (size, size) uint16 array, one code per agent
+        """
+        candidate_scores = FITNESS_LUT[candidate_codes]
+        stacked_scores = np.concatenate(
+            [self.scores, candidate_scores[..., np.newaxis]], axis=-1
+        )
+        evict_idx = np.argmin(stacked_scores, axis=-1)
+
+        replace = evict_idx < config.POOL_SIZE
+        xs, ys = np.nonzero(replace)
+        self.codes[xs, ys, evict_idx[replace]] = candidate_codes[replace]
+        self.scores[xs, ys, evict_idx[replace]] = candidate_scores[replace]
+        self.ages[xs, ys, evict_idx[replace]] = 0
+        self._dominant_fresh = False
+
+    def get_dominant_codes(self) -> np.ndarray:
+        """
+        Select every agent's dominant meme code in one vectorized pass.
+
+        The election is skipped entirely when no pool has changed since
+        the last call, so per-step consumers (the update itself, stats,
+        the renderer) share a single election.
+
+        Returns:
+            (size, size) uint16 array of dominant codes (the grid-owned
+            snapshot buffer, refreshed in place when stale)
+        """
+        if not self._dominant_fresh:
+            dominant_idx = np.argmax(self.scores, axis=-1)
+            self.dominant_codes[:] = np.take_along_axis(
+                self.codes, dominant_idx[..., np.newaxis], axis=-1
+            )[..., 0]
+            self._dominant_fresh = True
+        return self.dominant_codes
+
+    def dominant_matrix(self) -> np.ndarray:
+        """
+        Unpack every agent's dominant meme into per-bit form in one
+        vectorized pass over the cached dominant-code snapshot.
+
+        Returns:
+            (size, size, MEME_LENGTH) uint8 array with one bit per entry
+        """
+        return unpack_codes(self.get_dominant_codes())
+
     def get_grid_stats(self) -> dict:
         """
         Calculate statistics across all agents in the grid.
-        
+
         Returns:
             Dictionary with grid-wide statistics
         """
-        all_agents = self.get_all_agents()
-        
-        # Collect dominant meme metrics
-        dominant_complexities = []
-        dominant_utilities = []
-        dominant_scores = []
-        
-        for agent in all_agents:
-            dominant = agent.get_dominant_meme()
-            dominant_complexities.append(dominant.complexity)
-            dominant_utilities.append(dominant.utility)
-            dominant_scores.append(dominant.combined_score(
-                config.ALPHA if hasattr(config, 'ALPHA') else 1.0,
-                config.BETA if hasattr(config, 'BETA') else 0.5
-            ))
-        
-        # Collect all pool metrics
-        all_complexities = []
-        all_utilities = []
-        
-        for agent in all_agents:
-            for meme in agent.meme_pool:
-                all_complexities.append(meme.complexity)
-                all_utilities.append(meme.utility)
-        
-        # Collect unique patterns (as tuples for hashing)
-        unique_patterns = set()
-        for agent in all_agents:
-            for meme in agent.meme_pool:
-                unique_patterns.add(tuple(meme.pattern))
-        
+        # Dominant meme metrics: one vectorized election plus LUT gathers
+        dominant_codes = self.get_dominant_codes()
+        dominant_complexities = COMPLEXITY_LUT[dominant_codes]
+        dominant_utilities = UTILITY_LUT[dominant_codes]
+        alpha = config.ALPHA if hasattr(config, 'ALPHA') else 1.0
+        beta = config.BETA if hasattr(config, 'BETA') else 0.5
+        dominant_scores = alpha * dominant_utilities - beta * dominant_complexities
+
+        # Pool-wide metrics are single LUT gathers over the code arrays
+        all_complexities = COMPLEXITY_LUT[self.codes]
+        all_utilities = UTILITY_LUT[self.codes]
+
+        # Unique bit-packed codes across all pools. The 16-bit domain is
+        # finite, so counting-sort-style uniquing via bincount beats the
+        # sort inside np.unique
+        unique_patterns = int(
+            np.bincount(
+                self.codes.ravel(), minlength=1 << config.MEME_LENGTH
+            ).astype(bool).sum()
+        )
+        total_patterns = self.codes.size
+
         return {
             # Dominant meme statistics
             'avg_dominant_complexity': np.mean(dominant_complexities),
@@ -167,14 +217,13 @@ class Grid:
             'min_dominant_utility': np.min(dominant_utilities),
             'max_dominant_utility': np.max(dominant_utilities),
             'avg_dominant_score': np.mean(dominant_scores),
-            
+
             # Pool-wide statistics
             'avg_pool_complexity': np.mean(all_complexities),
             'avg_pool_utility': np.mean(all_utilities),
-            
+
             # Diversity metrics
-            'unique_patterns': len(unique_patterns),
-            'total_patterns': len(all_complexities),
-            'pattern_diversity': len(unique_patterns) / len(all_complexities) if all_complexities else 0,
+            'unique_patterns': unique_patterns,
+            'total_patterns': total_patterns,
+            'pattern_diversity': unique_patterns / total_patterns if total_patterns else 0,
         }
-
@@ -6,176 +6,389 @@ from typing import List
 import config
 
 
+# Pattern validation walks the whole pattern per construction. The hot
+# paths build memes via from_code and never pay it; for the remaining
+# cold constructors it can be switched off here (and -O strips the
+# asserts regardless).
+_VALIDATE_PATTERNS = __debug__
+
+
 class Meme:
     """
     A meme is a binary pattern that can be copied with potential mutations.
     Its Shannon entropy / complexity determines its copying fidelity.
+
+    The canonical representation is a single integer `code` with bit i
+    holding pattern[i], so copying, equality and hashing are plain integer
+    operations instead of per-element array work. The unpacked `pattern`
+    array is reconstructed lazily for consumers that need it (e.g. the
+    renderer).
+
+    Instances are immutable snapshots: no method mutates a meme in
+    place, so pools of memes can be shallow-copied safely and updates
+    (mutation, aging) always produce new instances.
     """
-    
+
+    __slots__ = ('code', 'age', '_pattern')
+
     def __init__(self, pattern: List[int], age: int = 0):
         """
         Initialize a meme with a binary pattern.
-        
+
         Args:
             pattern: List of 0s and 1s of length config.MEME_LENGTH
             age: The age of this meme (generations since creation)
         """
-        assert len(pattern) == config.MEME_LENGTH, f"Pattern must be length {config.MEME_LENGTH}"
-        assert all(bit in [0, 1] for bit in pattern), "Pattern must contain only 0s and 1s"
-        
-        self.pattern = np.array(pattern, dtype=np.int8)
+        if _VALIDATE_PATTERNS:
+            assert len(pattern) == config.MEME_LENGTH, f"Pattern must be length {config.MEME_LENGTH}"
+            assert all(bit in [0, 1] for bit in pattern), "Pattern must contain only 0s and 1s"
+
+        self.code = sum(int(bit) << i for i, bit in enumerate(pattern))
         self.age = age
-        self._entropy = None  # Cached entropy value
-        self._complexity = None  # Cached complexity value
-        self._utility = None  # Cached utility value
-    
+        self._pattern = None  # Lazily unpacked pattern array
+
+    @classmethod
+    def from_code(cls, code: int, age: int = 0) -> 'Meme':
+        """
+        Create a meme directly from its bit-packed code.
+
+        This skips the list conversion and validation in __init__, so
+        copies (the hot path) cost a single integer assignment.
+
+        Args:
+            code: Bit-packed pattern (bit i holds pattern[i])
+            age: The age of this meme (generations since creation)
+
+        Returns:
+            A new Meme instance
+        """
+        meme = cls.__new__(cls)
+        meme.code = int(code)
+        meme.age = age
+        meme._pattern = None
+        return meme
+
+    @property
+    def pattern(self) -> np.ndarray:
+        """
+        The binary pattern as an int8 array, unpacked lazily from the code.
+        """
+        if self._pattern is None:
+            n_bytes = (config.MEME_LENGTH + 7) // 8
+            packed = np.frombuffer(self.code.to_bytes(n_bytes, 'little'), dtype=np.uint8)
+            self._pattern = np.unpackbits(
+                packed, count=config.MEME_LENGTH, bitorder='little'
+            ).astype(np.int8)
+        return self._pattern
+
     @property
     def complexity(self) -> float:
         """
         Calculate the complexity of the binary pattern.
         """
-        # Maximum entropy for a binary pattern
-        entrop_max = np.log2(len(self.pattern))
+        return float(COMPLEXITY_LUT[self.code])
 
-        return self.entropy / entrop_max
-    
     def hamming_distance(self, other_meme: 'Meme') -> float:
         """
         Calculate normalized Hamming distance to another meme.
-        
+
         Args:
             other_meme: The meme to compare against
-            
+
         Returns:
             Normalized Hamming distance in [0, 1] where 0 = identical, 1 = completely different
         """
-        # Count differing bits
-        diff_bits = np.sum(self.pattern != other_meme.pattern)
+        # Count differing bits with a single popcount on the XOR
+        diff_bits = (self.code ^ other_meme.code).bit_count()
         # Normalize by pattern length
-        return diff_bits / len(self.pattern)
-    
+        return diff_bits / config.MEME_LENGTH
+
     @property
     def utility(self) -> float:
         """
         Calculate the utility of the binary pattern based on proximity to utility patterns.
-        
+
         Utility is defined as inverse Hamming distance to the nearest utility pattern:
         U = 1 - min_hamming_distance
-        
+
         Returns:
             Utility value in [0, 1] where 1 = perfect match to a utility pattern
         """
-        if self._utility is not None:
-            return self._utility
-        
-        # If no utility patterns defined, return 0
-        if not hasattr(config, 'UTILITY_PATTERNS') or not config.UTILITY_PATTERNS:
-            self._utility = 0.0
-            return self._utility
-        
-        # Calculate minimum Hamming distance to all utility patterns
-        min_distance = float('inf')
-        for utility_pattern in config.UTILITY_PATTERNS:
-            utility_meme = Meme(utility_pattern)
-            distance = self.hamming_distance(utility_meme)
-            min_distance = min(min_distance, distance)
-        
-        # Convert distance to utility (inverse)
-        self._utility = 1.0 - min_distance
-        return self._utility
-    
+        return float(UTILITY_LUT[self.code])
+
     @property
     def entropy(self) -> float:
         """
         Calculate Shannon entropy H of the binary pattern.
-        
+
         H = -(p_0 * log2(p_0) + p_1 * log2(p_1))
         where p_0 = N_0/L and p_1 = N_1/L
-        
+
         Returns:
             Shannon entropy (0 to H_max, where H_max is maximum entropy)
         """
-        if self._entropy is not None:
-            return self._entropy
-        
-        # Count zeros and ones
-        n_ones = np.sum(self.pattern)
-        n_zeros = len(self.pattern) - n_ones
-        
-        # Calculate probabilities
-        p_0 = n_zeros / len(self.pattern)
-        p_1 = n_ones / len(self.pattern)
-        
-        # Calculate entropy (handle log(0) case)
-        entropy = 0.0
-        if p_0 > 0:
-            entropy -= p_0 * np.log2(p_0)
-        if p_1 > 0:
-            entropy -= p_1 * np.log2(p_1)
-        
-        self._entropy = entropy
-        return self._entropy
-    
+        # Entropy depends only on the popcount; all possible values are
+        # tabulated at import time
+        return float(_ENTROPY_BY_POPCOUNT[self.code.bit_count()])
+
     def copy_with_mutation(self, mu_base: float, rng: np.random.Generator) -> 'Meme':
         """
         Create a copy of this meme with mutations based on its complexity.
-        
+
         The effective mutation rate is:
         mu_eff = mu_base + k * complexity(source)
-        
+
         Args:
             mu_base: Base mutation rate (mu_int or mu_ext)
             rng: Random number generator
-            
+
         Returns:
             A new Meme instance (potentially mutated copy)
         """
         # Calculate effective mutation rate based on complexity
         mu_eff = mu_base + config.COMPLEXITY_SCALE_FACTOR * self.complexity
-        
-        # Copy pattern and apply mutations
-        new_pattern = self.pattern.copy()
-        
-        # Each bit has mu_eff probability of flipping
-        mutation_mask = rng.random(len(new_pattern)) < mu_eff
-        new_pattern[mutation_mask] = 1 - new_pattern[mutation_mask]
-        
-        return Meme(new_pattern.tolist(), age=0)
-    
-    def increment_age(self):
-        """Increment the age of this meme."""
-        self.age += 1
-    
+
+        # Each bit has mu_eff probability of flipping; pack the flips into
+        # a uint16 mask and apply all mutations with a single XOR
+        flips = rng.random(config.MEME_LENGTH) < mu_eff
+        flip_mask = int(
+            np.packbits(flips, bitorder='little').view('<u2')[0]
+        )
+
+        return Meme.from_code(self.code ^ flip_mask, age=0)
+
+    def increment_age(self) -> 'Meme':
+        """
+        Return a copy of this meme with its age incremented.
+
+        Memes are treated as immutable snapshots (the live ages are the
+        grid's uint8 array), so aging is a functional update rather than
+        an in-place mutation.
+
+        Returns:
+            A new Meme with the same code and age + 1
+        """
+        return Meme.from_code(self.code, age=self.age + 1)
+
     def combined_score(self, alpha: float, beta: float) -> float:
         """
         Calculate the combined fitness score balancing utility and complexity.
-        
+
         S = (α × U) - (β × C)
-        
+
         Args:
             alpha: Weight for utility (higher = favor useful patterns)
             beta: Weight for complexity (higher = favor simple patterns)
-            
+
         Returns:
             Combined score (higher is better)
         """
         return (alpha * self.utility) - (beta * self.complexity)
-    
+
     def __repr__(self) -> str:
-        pattern_str = ''.join(str(bit) for bit in self.pattern)
+        # Binary-format the code directly; reversed so the string reads
+        # pattern[0] first, matching the old per-bit join
+        pattern_str = f"{self.code:0{config.MEME_LENGTH}b}"[::-1]
         return f"Meme(pattern={pattern_str}, C={self.complexity:.3f}, U={self.utility:.3f}, age={self.age})"
-    
+
     @staticmethod
     def random(rng: np.random.Generator) -> 'Meme':
         """
         Create a random meme with white noise pattern.
-        
+
+        A uniform draw over the code space is exactly iid Bernoulli(1/2)
+        bits, so one integer draw replaces the per-bit list round trip.
+        (Grid init batch-draws whole code arrays the same way.)
+
         Args:
             rng: Random number generator
-            
+
         Returns:
             A new Meme with random binary pattern
         """
-        pattern = rng.integers(0, 2, size=config.MEME_LENGTH).tolist()
-        return Meme(pattern)
+        return Meme.from_code(int(rng.integers(0, 1 << config.MEME_LENGTH)))
+
+
+# Utility patterns as bit-packed uint16 codes, built once at import time
+# for the scalar utility property, the vectorized helpers below and the
+# compiled step kernel
+if hasattr(config, 'UTILITY_PATTERNS') and config.UTILITY_PATTERNS:
+    UTILITY_CODES = np.packbits(
+        np.array(config.UTILITY_PATTERNS, dtype=np.uint8),
+        axis=-1, bitorder='little'
+    ).view('<u2')[:, 0]
+else:
+    UTILITY_CODES = np.empty(0, dtype=np.uint16)
+
+
+def unpack_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Unpack an array of bit-packed meme codes into binary patterns.
+
+    Args:
+        codes: uint16 array of bit-packed codes, any shape
+
+    Returns:
+        uint8 array of shape codes.shape + (MEME_LENGTH,) with one bit per entry
+    """
+    code_bytes = codes.astype('<u2')[..., np.newaxis].view(np.uint8)
+    return np.unpackbits(
+        code_bytes, axis=-1, count=config.MEME_LENGTH, bitorder='little'
+    )
+
+
+def _entropy_of_p(p_1: np.ndarray) -> np.ndarray:
+    """
+    Two-symbol Shannon entropy for an array of ones-probabilities.
+
+    Branchless: the zero-probability case is handled with masked log2
+    evaluation (0 * log2(0) contributes exactly 0) instead of branches
+    or nan cleanup, keeping the whole computation one vectorized pass.
+    """
+    p_0 = 1.0 - p_1
+    log_p0 = np.log2(p_0, where=p_0 > 0, out=np.zeros_like(p_0))
+    log_p1 = np.log2(p_1, where=p_1 > 0, out=np.zeros_like(p_1))
+    return -(p_0 * log_p0 + p_1 * log_p1)
+
+
+# Shannon entropy depends only on the popcount, so the MEME_LENGTH + 1
+# possible values are tabulated once and the scalar entropy property is
+# a popcount plus one table load
+_ENTROPY_BY_POPCOUNT = _entropy_of_p(
+    np.arange(config.MEME_LENGTH + 1) / config.MEME_LENGTH
+)
+
+
+def _compute_complexity_of_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Compute complexity (normalized Shannon entropy) for an array of codes.
+    Used once at import time to build COMPLEXITY_LUT.
+    """
+    p_1 = np.bitwise_count(codes) / config.MEME_LENGTH
+    return _entropy_of_p(p_1) / np.log2(config.MEME_LENGTH)
+
+
+def _compute_utility_of_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Compute utility (inverse Hamming distance to the nearest utility
+    pattern) for an array of codes. Used once at import time to build
+    UTILITY_LUT.
+    """
+    if UTILITY_CODES.size == 0:
+        return np.zeros(codes.shape, dtype=np.float64)
+
+    # XOR every code against every packed utility pattern, popcount the
+    # differences and keep the minimum Hamming distance
+    diff_bits = np.bitwise_count(codes[..., np.newaxis] ^ UTILITY_CODES)
+    min_distance = diff_bits.min(axis=-1) / config.MEME_LENGTH
+    return 1.0 - min_distance
+
 
+# Only 2^MEME_LENGTH distinct memes exist, so complexity, utility and the
+# config-weighted combined score are tabulated exhaustively at import time
+# (3 x 256 KB for the default length of 16). Every metric evaluation in
+# the hot paths is then a single table load.
+_ALL_CODES = np.arange(1 << config.MEME_LENGTH, dtype=np.uint16)
+COMPLEXITY_LUT = _compute_complexity_of_codes(_ALL_CODES).astype(np.float32)
+UTILITY_LUT = _compute_utility_of_codes(_ALL_CODES).astype(np.float32)
+SCORE_LUT = config.ALPHA * UTILITY_LUT - config.BETA * COMPLEXITY_LUT
+
+# Selection fitness per code: the combined score under utility selection,
+# negated complexity otherwise. Both election rules (highest score /
+# lowest complexity) and both eviction rules (lowest score / highest
+# complexity) then reduce to argmax/argmin over one table.
+if config.USE_UTILITY_SELECTION:
+    FITNESS_LUT = SCORE_LUT
+else:
+    FITNESS_LUT = -COMPLEXITY_LUT
+
+
+def complexity_of_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Calculate complexity (normalized Shannon entropy) for an array of codes.
+
+    Args:
+        codes: uint16 array of bit-packed codes, any shape
+
+    Returns:
+        float32 array of complexities with the same shape as codes
+    """
+    return COMPLEXITY_LUT[codes]
+
+
+def utility_of_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Calculate utility (inverse Hamming distance to the nearest utility
+    pattern) for an array of codes.
+
+    Args:
+        codes: uint16 array of bit-packed codes, any shape
+
+    Returns:
+        float32 array of utilities with the same shape as codes
+    """
+    return UTILITY_LUT[codes]
+
+
+def mutate_with_uniforms(codes: np.ndarray, mu_eff,
+                         uniforms: np.ndarray) -> np.ndarray:
+    """
+    Copy an array of codes, flipping bit i wherever uniforms[..., i] falls
+    below mu_eff.
+
+    The caller supplies the pre-drawn uniforms, so all randomness for a
+    batch can be generated up front in one rng call; the flips are packed
+    into uint16 masks and applied with one XOR, so mutating the whole
+    grid costs a handful of numpy ops instead of one Python call per meme.
+
+    Args:
+        codes: uint16 array of bit-packed codes, any shape
+        mu_eff: Effective mutation rate(s), broadcastable to codes.shape
+        uniforms: Uniform [0, 1) draws of shape codes.shape + (MEME_LENGTH,)
+
+    Returns:
+        uint16 array of mutated codes with the same shape as codes
+    """
+    flips = uniforms < np.asarray(mu_eff)[..., np.newaxis]
+    # Codes are uint16, so the packed flips are exactly two bytes per meme
+    flip_masks = np.packbits(
+        flips, axis=-1, bitorder='little'
+    ).view('<u2')[..., 0]
+    return codes ^ flip_masks
+
+
+def vector_mutate(codes: np.ndarray, mu_eff, rng: np.random.Generator) -> np.ndarray:
+    """
+    Copy an array of codes, flipping each bit with probability mu_eff.
+
+    Convenience wrapper around mutate_with_uniforms that draws the
+    Bernoulli uniforms for the whole batch in a single rng call.
+
+    Args:
+        codes: uint16 array of bit-packed codes, any shape
+        mu_eff: Effective mutation rate(s), broadcastable to codes.shape
+        rng: Random number generator
+
+    Returns:
+        uint16 array of mutated codes with the same shape as codes
+    """
+    uniforms = rng.random(codes.shape + (config.MEME_LENGTH,))
+    return mutate_with_uniforms(codes, mu_eff, uniforms)
+
+
+def score_of_codes(codes: np.ndarray, alpha: float, beta: float) -> np.ndarray:
+    """
+    Calculate the combined score S = (α × U) - (β × C) for an array of codes.
+
+    Args:
+        codes: uint16 array of bit-packed codes, any shape
+        alpha: Weight for utility
+        beta: Weight for complexity
+
+    Returns:
+        float32 array of scores with the same shape as codes
+
+    Note:
+        For the config weights, prefer indexing SCORE_LUT directly.
+    """
+    return alpha * UTILITY_LUT[codes] - beta * COMPLEXITY_LUT[codes]
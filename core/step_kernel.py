@@ -0,0 +1,147 @@
+"""
+Numba-compiled kernel for the per-generation grid update.
+
+The whole generation — internal rehearsal, pool eviction, dominance
+election and external invasion — runs as compiled parallel loops over
+the grid's code/age arrays, with no Python object allocation inside the
+hot loops. All random numbers are drawn by the caller in bulk, and all
+per-meme metrics come from the precomputed lookup tables in core.meme,
+so the kernel itself is deterministic given its inputs and every metric
+evaluation is a single table load.
+
+Numba is optional: when it is not installed the module still imports and
+the engine falls back to the vectorized numpy path.
+"""
+import numpy as np
+import config
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so this module imports without numba."""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+    prange = range
+
+
+# Moore neighborhood offsets in the same order as Grid.get_moore_neighbors
+_MOORE_DX = np.array([-1, -1, -1, 0, 0, 1, 1, 1], dtype=np.int64)
+_MOORE_DY = np.array([-1, 0, 1, -1, 1, -1, 0, 1], dtype=np.int64)
+
+# Pool size and meme length never change at runtime. Numba treats
+# module-level ints as compile-time constants, so the K-wide eviction /
+# election loops and the 16-wide flip loop below fully unroll, and
+# cache=True persists the compiled kernels across processes.
+_POOL_SIZE = int(config.POOL_SIZE)
+_MEME_LENGTH = int(config.MEME_LENGTH)
+
+
+@njit(fastmath=True, cache=True)
+def _flip_mask(uniforms, mu_eff):
+    """Pack per-bit Bernoulli(mu_eff) flips into an integer mask."""
+    mask = 0
+    for i in range(_MEME_LENGTH):
+        if uniforms[i] < mu_eff:
+            mask |= 1 << i
+    return mask
+
+
+@njit(fastmath=True, cache=True)
+def _insert(codes, ages, scores, x, y, candidate, fitness_lut):
+    """
+    Insert a candidate code into the pool at (x, y), evicting the least
+    fit among the current memes plus the candidate. If the candidate
+    itself is least fit, the pool is unchanged. Pool fitness comes from
+    the cached per-slot scores; only the candidate needs a table load.
+    """
+    worst_fitness = scores[x, y, 0]
+    worst_idx = 0
+    for j in range(1, _POOL_SIZE):
+        if scores[x, y, j] < worst_fitness:
+            worst_fitness = scores[x, y, j]
+            worst_idx = j
+
+    candidate_fitness = fitness_lut[candidate]
+    if candidate_fitness >= worst_fitness:
+        codes[x, y, worst_idx] = candidate
+        scores[x, y, worst_idx] = candidate_fitness
+        ages[x, y, worst_idx] = 0
+
+
+@njit(fastmath=True, cache=True)
+def _dominant_index(scores, x, y):
+    """Pool index of the dominant (fittest) meme at (x, y)."""
+    best_fitness = scores[x, y, 0]
+    best_idx = 0
+    for j in range(1, _POOL_SIZE):
+        if scores[x, y, j] > best_fitness:
+            best_fitness = scores[x, y, j]
+            best_idx = j
+    return best_idx
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def step(codes, ages, scores, dominant_codes, source_idx, internal_uniforms,
+         neighbor_dir, external_uniforms,
+         complexity_lut, fitness_lut, mu_int, mu_ext, k_scale):
+    """
+    Execute one full generation in place on the grid arrays.
+
+    Args:
+        codes: (N, N, POOL_SIZE) uint16 array of bit-packed meme codes
+        ages: (N, N, POOL_SIZE) uint8 array of meme ages
+        scores: (N, N, POOL_SIZE) float32 cached fitness per pool slot,
+            kept in sync with codes on every eviction
+        dominant_codes: (N, N) uint16 scratch buffer, filled with the
+            post-internal dominant snapshot that phase 2 reads from
+        source_idx: (N, N) rehearsal source index per agent
+        internal_uniforms: (N, N, MEME_LENGTH) uniforms for internal flips
+        neighbor_dir: (N, N) Moore-neighbor direction (0..7) per agent
+        external_uniforms: (N, N, MEME_LENGTH) uniforms for external flips
+        complexity_lut: float32[65536] complexity per code
+        fitness_lut: float32[65536] selection fitness per code (combined
+            score under utility selection, negated complexity otherwise)
+        mu_int: Base internal mutation rate
+        mu_ext: Base external mutation rate
+        k_scale: Scaling factor for complexity contribution to mutation
+    """
+    size = codes.shape[0]
+
+    # Phase 1: Internal dynamics (each agent only touches its own pool)
+    for x in prange(size):
+        for y in range(size):
+            source = codes[x, y, source_idx[x, y]]
+            mu_eff = mu_int + k_scale * complexity_lut[source]
+            candidate = source ^ _flip_mask(internal_uniforms[x, y], mu_eff)
+            _insert(codes, ages, scores, x, y, candidate, fitness_lut)
+
+            # Ages saturate at the uint8 ceiling instead of wrapping
+            for j in range(_POOL_SIZE):
+                if ages[x, y, j] < 255:
+                    ages[x, y, j] = ages[x, y, j] + 1
+
+    # Dominance election snapshot (the state phase 2 READS from)
+    for x in prange(size):
+        for y in range(size):
+            idx = _dominant_index(scores, x, y)
+            dominant_codes[x, y] = codes[x, y, idx]
+
+    # Phase 2: External dynamics (reads the snapshot, writes own pool)
+    for x in prange(size):
+        for y in range(size):
+            direction = neighbor_dir[x, y]
+            nx = (x + _MOORE_DX[direction]) % size
+            ny = (y + _MOORE_DY[direction]) % size
+
+            source = dominant_codes[nx, ny]
+            mu_eff = mu_ext + k_scale * complexity_lut[source]
+            candidate = source ^ _flip_mask(external_uniforms[x, y], mu_eff)
+            _insert(codes, ages, scores, x, y, candidate, fitness_lut)
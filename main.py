@@ -16,7 +16,7 @@ def main():
     """Run the meme simulation."""
     # Setup logging (use "DEBUG" for detailed per-agent logs)
     log_level = "INFO"  # Change to "DEBUG" for detailed logging
-    log_file = setup_logging(log_level)
+    log_file, log_listener = setup_logging(log_level)
     
     logger = logging.getLogger(__name__)
     logger.info("=" * 60)
@@ -96,6 +96,7 @@ def main():
         
         # Clean up
         renderer.quit()
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ Simulation engine coordinating the two-tiered evolution process.
 import numpy as np
 import logging
 from core.grid import Grid
+from core.meme import Meme, COMPLEXITY_LUT, FITNESS_LUT, complexity_of_codes, mutate_with_uniforms
+from core import step_kernel
 import config
 
 
@@ -35,14 +37,25 @@ class SimulationEngine:
         Execute one generation of the simulation.
         Implements the complete cycle from the specification.
         """
-        logger.debug(f"=== Generation {self.generation} ===")
-        
-        # Phase 1: Internal Dynamics
-        self._internal_dynamics_phase()
-        
-        # Phase 2: External Dynamics
-        self._external_dynamics_phase()
-        
+        logger.debug("=== Generation %d ===", self.generation)
+
+        # All randomness for the generation is drawn here in bulk, so the
+        # update itself (either backend) runs without any rng calls and
+        # both backends consume an identical stream
+        draws = self._draw_generation_randomness()
+
+        if step_kernel.NUMBA_AVAILABLE and config.USE_NUMBA:
+            # Both phases fused into one compiled parallel kernel
+            self._step_compiled(*draws)
+        else:
+            source_idx, internal_uniforms, neighbor_dir, external_uniforms = draws
+
+            # Phase 1: Internal Dynamics
+            self._internal_dynamics_phase(source_idx, internal_uniforms)
+
+            # Phase 2: External Dynamics
+            self._external_dynamics_phase(neighbor_dir, external_uniforms)
+
         # Increment generation counter
         self.generation += 1
         
@@ -68,98 +81,170 @@ class SimulationEngine:
                 f"total_patterns={stats['total_patterns']}"
             )
     
-    def _internal_dynamics_phase(self):
+    def _draw_generation_randomness(self):
+        """
+        Draw every random number one generation needs in four bulk calls:
+        rehearsal source indices, internal flip uniforms, neighbor
+        directions and external flip uniforms. Amortizing the rng
+        overhead across all N²·L events per phase keeps the Python/C
+        boundary out of the update loops entirely.
+
+        Returns:
+            Tuple (source_idx, internal_uniforms, neighbor_dir,
+            external_uniforms)
+        """
+        shape = (self.grid.size, self.grid.size)
+
+        source_idx = self.rng.integers(0, config.POOL_SIZE, size=shape)
+        internal_uniforms = self.rng.random(shape + (config.MEME_LENGTH,))
+        neighbor_dir = self.rng.integers(0, 8, size=shape)
+        external_uniforms = self.rng.random(shape + (config.MEME_LENGTH,))
+
+        return source_idx, internal_uniforms, neighbor_dir, external_uniforms
+
+    def _step_compiled(self, source_idx, internal_uniforms,
+                       neighbor_dir, external_uniforms):
+        """
+        Execute one generation via the Numba step kernel. The kernel runs
+        without any rng or Python calls inside its loops; everything
+        random comes in through the pre-drawn arrays.
+        """
+        grid = self.grid
+
+        step_kernel.step(
+            grid.codes, grid.ages, grid.scores, grid.dominant_codes,
+            source_idx, internal_uniforms,
+            neighbor_dir, external_uniforms,
+            COMPLEXITY_LUT, FITNESS_LUT,
+            config.MU_BASE_INTERNAL, config.MU_BASE_EXTERNAL,
+            config.COMPLEXITY_SCALE_FACTOR,
+        )
+
+        # The kernel left the mid-step (post-internal) snapshot in the
+        # dominant buffer; phase 2 has since written the pools
+        grid._dominant_fresh = False
+
+    def _internal_dynamics_phase(self, source_idx, internal_uniforms):
         """
         Phase 1: Internal Dynamics
-        
+
         Each agent:
         1.1 Self-Rehearsal: Copy a random meme with internal mutation
         1.2 Pool Update: Remove highest complexity if pool exceeds size
         1.3 Dominance Election: Select lowest complexity meme as dominant
+
+        Args:
+            source_idx: (N, N) rehearsal source index per agent
+            internal_uniforms: (N, N, MEME_LENGTH) uniforms for the flips
         """
         logger.debug("Phase 1: Internal Dynamics")
-        
-        all_agents = self.grid.get_all_agents()
-        
-        for agent in all_agents:
-            # 1.1 & 1.2: Internal rehearsal (includes pool management)
-            agent.internal_rehearsal(self.rng)
-            
-            # Age all memes
-            agent.age_memes()
-            
-            # 1.3: Dominance election (happens automatically when needed)
-            dominant = agent.get_dominant_meme()
-            
-            if logger.isEnabledFor(logging.DEBUG):
+
+        grid = self.grid
+
+        # 1.1: Gather each agent's rehearsal source and copy all of them
+        # with internal mutation in a single vectorized batch
+        source_codes = np.take_along_axis(
+            grid.codes, source_idx[..., np.newaxis], axis=-1
+        )[..., 0]
+        mu_eff = config.MU_BASE_INTERNAL \
+            + config.COMPLEXITY_SCALE_FACTOR * complexity_of_codes(source_codes)
+        rehearsed_codes = mutate_with_uniforms(
+            source_codes, mu_eff, internal_uniforms
+        )
+
+        # 1.2: Pool update for every agent in one fused eviction pass
+        grid.insert_codes(rehearsed_codes)
+
+        # Age all memes, saturating at the uint8 ceiling instead of
+        # wrapping back to 0
+        np.add(grid.ages, 1, out=grid.ages, where=grid.ages < 255)
+
+        # 1.3: Dominance election (happens automatically when needed)
+        if logger.isEnabledFor(logging.DEBUG):
+            for agent in grid.get_all_agents():
                 pool_stats = agent.get_pool_stats()
                 if config.USE_UTILITY_SELECTION:
                     logger.debug(
-                        f"Agent({agent.x},{agent.y}): "
-                        f"dom_C={pool_stats['dominant_complexity']:.4f}, "
-                        f"dom_U={pool_stats['dominant_utility']:.4f}, "
-                        f"dom_S={pool_stats['dominant_score']:.4f}, "
-                        f"pool_avg_U={pool_stats['avg_utility']:.4f}"
+                        "Agent(%d,%d): dom_C=%.4f, dom_U=%.4f, dom_S=%.4f, "
+                        "pool_avg_U=%.4f",
+                        agent.x, agent.y,
+                        pool_stats['dominant_complexity'],
+                        pool_stats['dominant_utility'],
+                        pool_stats['dominant_score'],
+                        pool_stats['avg_utility'],
                     )
                 else:
                     logger.debug(
-                        f"Agent({agent.x},{agent.y}): "
-                        f"dominant_C={pool_stats['dominant_complexity']:.4f}, "
-                        f"pool_avg_C={pool_stats['avg_complexity']:.4f}, "
-                        f"pool_size={pool_stats['pool_size']}"
+                        "Agent(%d,%d): dominant_C=%.4f, pool_avg_C=%.4f, "
+                        "pool_size=%d",
+                        agent.x, agent.y,
+                        pool_stats['dominant_complexity'],
+                        pool_stats['avg_complexity'],
+                        pool_stats['pool_size'],
                     )
     
-    def _external_dynamics_phase(self):
+    def _external_dynamics_phase(self, neighbor_dir, external_uniforms):
         """
         Phase 2: External Dynamics
-        
+
         Each agent:
         2.1 Target Selection: Select a random neighbor
         2.2 Mirroring & Error: Copy neighbor's dominant with external mutation
         2.3 External Invasion: Add to pool (remove highest H if full)
-        
-        IMPORTANT: This implements proper CA-style simultaneous update using
-        double buffering. All agents read from the OLD grid state and write
-        to NEW agent copies, then the grid is updated all at once.
+
+        IMPORTANT: This implements proper CA-style simultaneous update. All
+        agents read dominant memes from a snapshot of the pre-update grid
+        state, so writes into the live pool arrays cannot leak into the
+        reads of later agents.
+
+        Args:
+            neighbor_dir: (N, N) Moore-neighbor direction (0..7) per agent
+            external_uniforms: (N, N, MEME_LENGTH) uniforms for the flips
         """
         logger.debug("Phase 2: External Dynamics")
-        
-        # Get current grid state (these are the agents we READ from)
-        old_agents = self.grid.get_all_agents()
-        
-        # Create copies of all agents (these are the agents we WRITE to)
-        new_agents = [agent.copy() for agent in old_agents]
-        
-        # Build a mapping from (x, y) to new agent for easy lookup
-        new_agent_map = {(agent.x, agent.y): agent for agent in new_agents}
-        
-        # Process each agent using OLD grid for reading neighbors
-        for new_agent in new_agents:
-            # 2.1: Select random neighbor from OLD grid state
-            old_neighbors = self.grid.get_moore_neighbors(new_agent.x, new_agent.y)
-            selected_neighbor = self.rng.choice(old_neighbors)
-            
-            # 2.2 & 2.3: Copy dominant meme from OLD neighbor to NEW agent
-            neighbor_dominant = selected_neighbor.get_dominant_meme()
-            new_agent.receive_meme(neighbor_dominant, self.rng)
-            
-            if logger.isEnabledFor(logging.DEBUG):
+
+        grid = self.grid
+
+        # Snapshot every agent's dominant code (the state we READ from)
+        dominant_codes = grid.get_dominant_codes()
+
+        # 2.1: Resolve each agent's chosen neighbor from the OLD grid
+        # state through the precomputed neighbor-index tables as one
+        # grid-wide gather
+        rows = np.arange(grid.size)
+        neighbor_x = grid.neighbor_x[rows[:, np.newaxis], neighbor_dir]
+        neighbor_y = grid.neighbor_y[rows[np.newaxis, :], neighbor_dir]
+        selected_codes = dominant_codes[neighbor_x, neighbor_y]
+
+        # 2.2: Mirror all selected dominants with external mutation in a
+        # single vectorized batch
+        mu_eff = config.MU_BASE_EXTERNAL \
+            + config.COMPLEXITY_SCALE_FACTOR * complexity_of_codes(selected_codes)
+        invaded_codes = mutate_with_uniforms(
+            selected_codes, mu_eff, external_uniforms
+        )
+
+        # 2.3: External invasion, fused across all pools
+        grid.insert_codes(invaded_codes)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for x, y in np.ndindex(grid.size, grid.size):
+                nx, ny = neighbor_x[x, y], neighbor_y[x, y]
+                neighbor_dominant = Meme.from_code(int(dominant_codes[nx, ny]))
                 if config.USE_UTILITY_SELECTION:
                     logger.debug(
-                        f"Agent({new_agent.x},{new_agent.y}) <- "
-                        f"Agent({selected_neighbor.x},{selected_neighbor.y}): "
-                        f"copied meme C={neighbor_dominant.complexity:.4f}, "
-                        f"U={neighbor_dominant.utility:.4f}"
+                        "Agent(%d,%d) <- Agent(%d,%d): copied meme C=%.4f, "
+                        "U=%.4f",
+                        x, y, nx, ny,
+                        neighbor_dominant.complexity,
+                        neighbor_dominant.utility,
                     )
                 else:
                     logger.debug(
-                        f"Agent({new_agent.x},{new_agent.y}) <- "
-                        f"Agent({selected_neighbor.x},{selected_neighbor.y}): "
-                        f"copied meme with C={neighbor_dominant.complexity:.4f}"
+                        "Agent(%d,%d) <- Agent(%d,%d): copied meme with "
+                        "C=%.4f",
+                        x, y, nx, ny, neighbor_dominant.complexity,
                     )
-        
-        # State Update: Replace all agents in grid simultaneously
-        self.grid.set_all_agents(new_agents)
     
     def get_generation(self) -> int:
         """Get the current generation number."""
@@ -2,6 +2,8 @@
 Logging configuration for the meme simulation.
 """
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -10,28 +12,37 @@ from pathlib import Path
 def setup_logging(log_level: str = "INFO"):
     """
     Setup logging configuration with both file and console output.
-    
+
+    Log records are routed through a queue to a background listener
+    thread, so the simulation loop never blocks on handler I/O (at DEBUG
+    level the synchronous handlers cost a write syscall per agent per
+    generation).
+
     Args:
         log_level: Logging level ("DEBUG" or "INFO")
+
+    Returns:
+        Tuple (log_file, listener). The caller must call listener.stop()
+        on shutdown to flush queued records.
     """
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
+
     # Create timestamped log filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"memesim_{timestamp}.log"
-    
+
     # Convert log_level string to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Capture everything
-    
+
     # Clear any existing handlers
     root_logger.handlers.clear()
-    
+
     # File handler (gets everything at specified level)
     file_handler = logging.FileHandler(log_file, mode='w')
     file_handler.setLevel(numeric_level)
@@ -40,8 +51,7 @@ def setup_logging(log_level: str = "INFO"):
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
-    
+
     # Console handler (INFO only for cleaner output)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
@@ -49,11 +59,18 @@ def setup_logging(log_level: str = "INFO"):
         '%(levelname)s: %(message)s'
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
-    
+
+    # The simulation thread only enqueues records; the listener thread
+    # runs the real handlers (and their per-record level filtering)
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+
     # Log the startup
     logging.info(f"Logging initialized. Log file: {log_file}")
     logging.info(f"Log level: {log_level}")
-    
-    return log_file
 
+    return log_file, listener
@@ -47,61 +47,60 @@ class Renderer:
         # State
         self.paused = False
         self.running = True
+
+        # Snapshot of the dominant codes behind the last drawn frame;
+        # render() skips the rebuild while the grid is unchanged (e.g.
+        # while paused)
+        self._last_frame_key = None
         
         logger.info(f"Renderer initialized: {self.window_size}x{self.window_size} pixels")
     
     def render(self, generation: int):
         """
         Render the current state of the grid.
-        
+
         Args:
             generation: Current generation number
         """
-        self.screen.fill(self.COLOR_GRAY)
-        
-        # Render each agent
-        for x in range(self.grid.size):
-            for y in range(self.grid.size):
-                agent = self.grid.get_agent(x, y)
-                self._render_agent(agent, x, y)
-        
-        # Update display
-        pygame.display.flip()
-        
+        # Redraw only when the dominant snapshot actually changed; while
+        # paused (or between unchanged generations) the frame on screen
+        # is already correct and only the FPS clock needs servicing
+        frame_key = self.grid.get_dominant_codes().tobytes()
+        if frame_key != self._last_frame_key:
+            # Assemble the whole window as one array and blit it in a
+            # single call instead of issuing 16 draw.rect calls per agent
+            pygame.surfarray.blit_array(self.screen, self._build_frame())
+
+            # Update display
+            pygame.display.flip()
+            self._last_frame_key = frame_key
+
         # Control FPS
         self.clock.tick(config.FPS)
-    
-    def _render_agent(self, agent, grid_x: int, grid_y: int):
+
+    def _build_frame(self) -> np.ndarray:
         """
-        Render a single agent as a 4x4 bitmap of its dominant meme.
-        
-        Args:
-            agent: The agent to render
-            grid_x: Agent's x position on grid
-            grid_y: Agent's y position on grid
+        Assemble the full window contents as a single RGB pixel array,
+        with every agent's dominant meme as a 4x4 bitmap.
+
+        Returns:
+            (window_size, window_size, 3) uint8 array in surfarray's
+            (x, y) index order
         """
-        dominant_meme = agent.get_dominant_meme()
-        pattern = dominant_meme.pattern
-        
-        # Convert 16-length pattern to 4x4 grid
-        pattern_2d = pattern.reshape(4, 4)
-        
-        # Calculate screen position
-        screen_x = grid_x * self.agent_display_size
-        screen_y = grid_y * self.agent_display_size
-        
-        # Draw each pixel of the 4x4 meme pattern
-        for py in range(4):
-            for px in range(4):
-                color = self.COLOR_WHITE if pattern_2d[py, px] == 1 else self.COLOR_BLACK
-                
-                pixel_rect = pygame.Rect(
-                    screen_x + px * config.CELL_SIZE,
-                    screen_y + py * config.CELL_SIZE,
-                    config.CELL_SIZE,
-                    config.CELL_SIZE
-                )
-                pygame.draw.rect(self.screen, color, pixel_rect)
+        n = self.grid.size
+        bits = self.grid.dominant_matrix().reshape(n, n, 4, 4)
+
+        # Pattern bit 4*py+px is the pixel at (px, py) inside the agent's
+        # 4x4 bitmap; surfarray indexes the window as [x, y], so order the
+        # axes (grid_x, px, grid_y, py) before flattening to pixels
+        frame = bits.transpose(0, 3, 1, 2).reshape(4 * n, 4 * n) * np.uint8(255)
+
+        # Scale each meme pixel up to CELL_SIZE x CELL_SIZE and expand to
+        # (grayscale) RGB
+        frame = np.repeat(
+            np.repeat(frame, config.CELL_SIZE, axis=0), config.CELL_SIZE, axis=1
+        )
+        return np.repeat(frame[:, :, np.newaxis], 3, axis=2)
     
     def handle_events(self) -> bool:
         """